@@ -3,7 +3,7 @@ import argparse
 from pathlib import Path
 from langchain_core.messages import HumanMessage
 from .graphs.workflow import create_workflow
-from .states import ProjectState
+from .states import ProjectState, make_default_project_state
 from .cli import EnhancedCLI
 
 
@@ -29,45 +29,10 @@ async def main(project_path: str):
     
     app = create_workflow()
     
-    initial_state: ProjectState = {
-        "messages": [],
-        "project_path": str(project_path_obj.absolute()),
-        "project_name": project_path_obj.name,
-        "packaging_type": "jar",
-        "version": "1.0.0",
-        "description": None,
-        "java_classes": [],
-        "test_classes": [],
-        "current_class": None,
-        "maven_group_id": "",
-        "maven_artifact_id": "",
-        "dependencies": [],
-        "test_dependencies": [],
-        "transitive_dependencies": [],
-        "dependency_graph": {},
-        "plugins": [],
-        "build_status": {
-            "last_build_time": None,
-            "build_status": "not_built",
-            "build_duration": None,
-            "goals": [],
-            "output_directory": "target/classes",
-            "test_results": {},
-            "compilation_errors": []
-        },
-        "last_action": "initialized",
-        "summary_report": None,
-        "source_directory": "src/main/java",
-        "test_directory": "src/test/java",
-        "output_directory": "target",
-        "has_spring": False,
-        "has_junit": False,
-        "has_mockito": False,
-        "retry_count": 0,
-        "max_retries": 3,
-        "test_results": {},
-        "all_tests_passed": False
-    }
+    initial_state: ProjectState = make_default_project_state(
+        project_path=str(project_path_obj.absolute()),
+        project_name=project_path_obj.name
+    )
     
     try:
         while True:
@@ -8,7 +8,8 @@ from .project import (
     MavenDependencyState,
     MavenPluginState,
     MavenBuildState,
-    ProjectState
+    ProjectState,
+    make_default_project_state
 )
 
 __all__ = [
@@ -21,5 +22,6 @@ __all__ = [
     "MavenDependencyState",
     "MavenPluginState",
     "MavenBuildState",
-    "ProjectState"
+    "ProjectState",
+    "make_default_project_state"
 ]
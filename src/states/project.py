@@ -135,3 +135,55 @@ class ProjectState(TypedDict):
     max_retries: int
     test_results: dict
     all_tests_passed: bool
+
+
+# Immutable defaults for a fresh ProjectState; list and dict fields are
+# created per call in make_default_project_state so states never share them.
+_PROJECT_STATE_DEFAULTS = {
+    "project_path": "",
+    "project_name": "",
+    "packaging_type": "jar",
+    "version": "1.0.0",
+    "description": None,
+    "current_class": None,
+    "maven_group_id": "",
+    "maven_artifact_id": "",
+    "last_action": "initialized",
+    "summary_report": None,
+    "source_directory": "src/main/java",
+    "test_directory": "src/test/java",
+    "output_directory": "target",
+    "has_spring": False,
+    "has_junit": False,
+    "has_mockito": False,
+    "retry_count": 0,
+    "max_retries": 3,
+    "all_tests_passed": False
+}
+
+
+def make_default_project_state(**overrides) -> ProjectState:
+    """Return a new ProjectState with default values, updated with overrides."""
+    state = {
+        **_PROJECT_STATE_DEFAULTS,
+        "messages": [],
+        "java_classes": [],
+        "test_classes": [],
+        "dependencies": [],
+        "test_dependencies": [],
+        "transitive_dependencies": [],
+        "dependency_graph": {},
+        "plugins": [],
+        "build_status": {
+            "last_build_time": None,
+            "build_status": "not_built",
+            "build_duration": None,
+            "goals": [],
+            "output_directory": "target/classes",
+            "test_results": {},
+            "compilation_errors": []
+        },
+        "test_results": {}
+    }
+    state.update(overrides)
+    return state
@@ -1,3 +1,8 @@
+import copy
+import os
+from collections import deque
+from functools import lru_cache
+from stat import S_ISREG
 import javalang
 from pathlib import Path
 from typing import Optional, Union
@@ -209,6 +214,48 @@ def _extract_class_details_from_tree(source_file: str, tree: javalang.tree.Compi
     return classes
 
 
+def _first_class_state(file_path: str, tree: Optional[javalang.tree.CompilationUnit]) -> JavaClassState:
+    """Return the first class in a parsed tree, or an error state."""
+    if not tree:
+        return _make_error_class_state(
+            "Failed to parse Java source",
+            file_path
+        )
+
+    # Use unified extraction logic - SINGLE SOURCE OF TRUTH
+    classes = _extract_class_details_from_tree(file_path, tree)
+
+    if not classes:
+        return _make_error_class_state(
+            "No classes found in source",
+            file_path
+        )
+
+    # Return the first class
+    return classes[0]
+
+
+@lru_cache(maxsize=512)
+def _analyze_java_file_cached(path: str, mtime_ns: int, size: int) -> JavaClassState:
+    """Parse and analyze a Java file once per (path, mtime_ns, size).
+
+    The modification time and size are only part of the cache key; an edited
+    file gets a new key and is parsed again.
+    """
+    return _first_class_state(path, _parse_java_file(path))
+
+
+def _analyze_stat_file(path: str, stat: os.stat_result) -> JavaClassState:
+    """Analyze an already stat'ed Java file through the parse cache."""
+    try:
+        # Callers may mutate the result, so never hand out the cached copy
+        return copy.deepcopy(
+            _analyze_java_file_cached(path, stat.st_mtime_ns, stat.st_size)
+        )
+    except Exception as e:
+        return _make_error_class_state(str(e), path)
+
+
 def _analyze_java_class_impl(path: Optional[str] = None, source_code: Optional[str] = None) -> JavaClassState:
     """Analyze a single Java class from file path or source code.
 
@@ -256,33 +303,21 @@ def _analyze_java_class_impl(path: Optional[str] = None, source_code: Optional[s
         # Handle file path
         if path:
             validate_java_file(path)
-            file_path = path
-            tree = _parse_java_file(file_path)
-        else:
-            # Handle source code
-            file_path = "<inline_source>"
             try:
-                tree = javalang.parse.parse(source_code)
-            except Exception:
-                tree = None
-
-        if not tree:
-            return _make_error_class_state(
-                "Failed to parse Java source",
-                file_path
-            )
-
-        # Use unified extraction logic - SINGLE SOURCE OF TRUTH
-        classes = _extract_class_details_from_tree(file_path, tree)
-
-        if not classes:
-            return _make_error_class_state(
-                "No classes found in source",
-                file_path
-            )
-
-        # Return the first class
-        return classes[0]
+                stat = os.stat(path)
+            except OSError:
+                return _make_error_class_state(
+                    "Failed to parse Java source",
+                    path
+                )
+            return _analyze_stat_file(path, stat)
+
+        # Handle source code
+        try:
+            tree = javalang.parse.parse(source_code)
+        except Exception:
+            tree = None
+        return _first_class_state("<inline_source>", tree)
 
     except ValueError as e:
         # Re-raise validation errors
@@ -297,17 +332,44 @@ def analyze_java_class(path: Optional[str] = None, source_code: Optional[str] =
     return _analyze_java_class_impl(path=path, source_code=source_code)
 
 
-def _list_java_files(directory: str) -> list[Path]:
+def _list_java_files(directory: str) -> list[tuple[str, Optional[os.stat_result]]]:
     """Get all Java file paths in directory (private helper for file discovery).
 
+    Walks the tree breadth-first with ``os.scandir`` so each entry's type
+    comes from the directory listing and each Java file is stat'ed once.
+    Symlinked directories are not followed, matching ``Path.rglob``.
+
     Args:
         directory: Directory path to search for Java files
 
     Returns:
-        List of Path objects for all .java files found (sorted)
+        Sorted list of ``(path, stat)`` pairs for all .java entries found;
+        ``stat`` is None when the entry is a directory or could not be stat'ed
     """
-    path = validate_directory_exists(directory)
-    return sorted(path.rglob("*.java"))
+    root = str(validate_directory_exists(directory))
+    found: list[tuple[str, Optional[os.stat_result]]] = []
+    pending = deque(["" if root == os.curdir else root])
+    while pending:
+        current = pending.popleft()
+        try:
+            with os.scandir(current or os.curdir) as entries:
+                for entry in entries:
+                    entry_path = os.path.join(current, entry.name)
+                    is_java = entry.name.endswith(".java")
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry_path)
+                        if is_java:
+                            found.append((entry_path, None))
+                    elif is_java:
+                        try:
+                            found.append((entry_path, entry.stat()))
+                        except OSError:
+                            found.append((entry_path, None))
+        except OSError:
+            continue
+    # Sort by path components, the same order sorted() gives Path objects
+    found.sort(key=lambda item: item[0].split(os.sep))
+    return found
 
 
 @tool
@@ -334,15 +396,20 @@ def list_java_classes(directory: str) -> list[JavaClassState]:
             return []
 
         results: list[JavaClassState] = []
-        for java_file in java_files:
+        for java_file, stat in java_files:
             try:
-                class_state = _analyze_java_class_impl(path=str(java_file))
+                if stat is not None and S_ISREG(stat.st_mode):
+                    # The walk already stat'ed a regular .java file, so skip
+                    # re-validating it
+                    class_state = _analyze_stat_file(java_file, stat)
+                else:
+                    class_state = _analyze_java_class_impl(path=java_file)
                 results.append(class_state)
             except Exception as e:
                 # Include error states for failed analyses
                 results.append(_make_error_class_state(
                     f"Failed to analyze: {str(e)}",
-                    str(java_file)
+                    java_file
                 ))
 
         return results
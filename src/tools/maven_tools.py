@@ -7,6 +7,7 @@ from ..exceptions.handler import MavenError, FileOperationError, create_error_re
 from ..utils.validation import (
     validate_directory_exists,
     validate_project_directory,
+    _cached_project_directory,
     validate_not_empty,
     validate_maven_goal,
     validate_pom_xml,
@@ -386,7 +387,7 @@ def parse_pom_xml(pom_path: str) -> dict:
 def extract_dependencies(project_path: str) -> list[MavenDependencyState]:
     """Extract all dependencies from pom.xml."""
     try:
-        pom_xml = validate_project_directory(project_path) / "pom.xml"
+        pom_xml = _cached_project_directory(project_path) / "pom.xml"
         
         tree = ET.parse(pom_xml)
         root = tree.getroot()
@@ -423,7 +424,7 @@ def extract_dependencies(project_path: str) -> list[MavenDependencyState]:
 def extract_plugins(project_path: str) -> list[MavenPluginState]:
     """Extract all plugins from pom.xml."""
     try:
-        pom_xml = validate_project_directory(project_path) / "pom.xml"
+        pom_xml = _cached_project_directory(project_path) / "pom.xml"
         
         tree = ET.parse(pom_xml)
         root = tree.getroot()
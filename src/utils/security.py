@@ -1,10 +1,16 @@
 import re
 import os
 import shlex
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Set, Any
 from ..exceptions.handler import ValidationError
 
+try:
+    import hyperscan
+except ImportError:  # optional accelerator
+    hyperscan = None
+
 
 class SecurityUtils:
     """Utility functions for input sanitization and security."""
@@ -20,6 +26,7 @@ class SecurityUtils:
         r'\${.*}',        # Template injection
         r'%7B.*%7D',      # URL encoded template injection
     ]
+    _DANGEROUS_REGEXES = [(p, re.compile(p, re.IGNORECASE)) for p in DANGEROUS_PATTERNS]
     
     SHELL_INJECTION_PATTERNS = [
         r';\s*\w+',       # Command chaining
@@ -31,6 +38,7 @@ class SecurityUtils:
         r'>\s*[/\\]',     # Redirection to absolute path
         r'<\s*[/\\]',     # Input from absolute path
     ]
+    _SHELL_INJECTION_REGEXES = [(p, re.compile(p, re.IGNORECASE)) for p in SHELL_INJECTION_PATTERNS]
     
     SQL_INJECTION_PATTERNS = [
         r"'\s*(OR|AND)\s*",
@@ -40,6 +48,26 @@ class SecurityUtils:
         r'xp_cmdshell',
         r'sp_oacreate',
     ]
+    _SQL_INJECTION_REGEXES = [(p, re.compile(p, re.IGNORECASE)) for p in SQL_INJECTION_PATTERNS]
+    
+    # Each repetition of the package group starts with a literal '.', so the
+    # pattern is unambiguous and cannot backtrack catastrophically.
+    PACKAGE_NAME_PATTERN = re.compile(r'[a-z][a-z0-9_]*(?:\.[a-z][a-z0-9_]*)*')
+    CLASS_NAME_PATTERN = re.compile(r'[A-Z][a-zA-Z0-9_]*')
+    MEMBER_NAME_PATTERN = re.compile(r'[a-z][a-zA-Z0-9_]*')
+    
+    SECRET_PATTERNS = [
+        r'password\s*[:=]\s*["\']?[\w]+["\']?',
+        r'api[_-]?key\s*[:=]\s*["\']?[\w-]+["\']?',
+        r'secret[_-]?key\s*[:=]\s*["\']?[\w-]+["\']?',
+        r'access[_-]?token\s*[:=]\s*["\']?[\w.-]+["\']?',
+        r'private[_-]?key\s*[:=]\s*["\']?[\w.-]+["\']?',
+        r'authorization[:\s]+Bearer\s+[\w.-]+',
+        r'AKIA[0-9A-Z]{16}',
+        r'github_pat_[0-9a-zA-Z_]{82}',
+        r'sk-[0-9a-zA-Z]{48}',
+    ]
+    _SECRET_REGEXES = [(p, re.compile(p, re.IGNORECASE)) for p in SECRET_PATTERNS]
     
     @classmethod
     def sanitize_path(cls, path: str, allow_absolute: bool = False) -> str:
@@ -61,8 +89,8 @@ class SecurityUtils:
         
         path = path.strip()
         
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, path, re.IGNORECASE):
+        for pattern, regex in cls._DANGEROUS_REGEXES:
+            if regex.search(path):
                 raise ValidationError(
                     f"Path contains potentially dangerous pattern: {pattern}",
                     "path"
@@ -107,8 +135,8 @@ class SecurityUtils:
         
         command = command.strip()
         
-        for pattern in cls.SHELL_INJECTION_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
+        for pattern, regex in cls._SHELL_INJECTION_REGEXES:
+            if regex.search(command):
                 raise ValidationError(
                     f"Command contains potentially dangerous pattern: {pattern}",
                     "command"
@@ -160,8 +188,8 @@ class SecurityUtils:
         if not input_str:
             return input_str
         
-        for pattern in cls.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, input_str, re.IGNORECASE):
+        for pattern, regex in cls._SQL_INJECTION_REGEXES:
+            if regex.search(input_str):
                 raise ValidationError(
                     f"Input contains SQL injection pattern: {pattern}",
                     "sql_input"
@@ -196,8 +224,8 @@ class SecurityUtils:
                 return f"<{tag}>"
             return ""
         
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, input_str, re.IGNORECASE):
+        for pattern, regex in cls._DANGEROUS_REGEXES:
+            if regex.search(input_str):
                 raise ValidationError(
                     f"Input contains potentially dangerous pattern: {pattern}",
                     "html_input"
@@ -298,8 +326,7 @@ class SecurityUtils:
         
         package_name = package_name.strip().lower()
         
-        pattern = r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$'
-        if not re.match(pattern, package_name):
+        if not cls.PACKAGE_NAME_PATTERN.fullmatch(package_name):
             raise ValidationError(
                 f"Invalid package name '{package_name}'. "
                 "Package names must follow reverse domain notation (e.g., com.example.package)",
@@ -327,8 +354,7 @@ class SecurityUtils:
         
         class_name = class_name.strip()
         
-        pattern = r'^[A-Z][a-zA-Z0-9_]*$'
-        if not re.match(pattern, class_name):
+        if not cls.CLASS_NAME_PATTERN.fullmatch(class_name):
             raise ValidationError(
                 f"Invalid class name '{class_name}'. "
                 "Class names must start with uppercase letter and contain only alphanumeric characters and underscores",
@@ -356,8 +382,7 @@ class SecurityUtils:
         
         method_name = method_name.strip()
         
-        pattern = r'^[a-z][a-zA-Z0-9_]*$'
-        if not re.match(pattern, method_name):
+        if not cls.MEMBER_NAME_PATTERN.fullmatch(method_name):
             raise ValidationError(
                 f"Invalid method name '{method_name}'. "
                 "Method names must start with lowercase letter and contain only alphanumeric characters and underscores",
@@ -385,8 +410,7 @@ class SecurityUtils:
         
         field_name = field_name.strip()
         
-        pattern = r'^[a-z][a-zA-Z0-9_]*$'
-        if not re.match(pattern, field_name):
+        if not cls.MEMBER_NAME_PATTERN.fullmatch(field_name):
             raise ValidationError(
                 f"Invalid field name '{field_name}'. "
                 "Field names must start with lowercase letter and contain only alphanumeric characters and underscores",
@@ -406,24 +430,27 @@ class SecurityUtils:
         Returns:
             List of potential secret patterns found
         """
-        secret_patterns = [
-            r'password\s*[:=]\s*["\']?[\w]+["\']?',
-            r'api[_-]?key\s*[:=]\s*["\']?[\w-]+["\']?',
-            r'secret[_-]?key\s*[:=]\s*["\']?[\w-]+["\']?',
-            r'access[_-]?token\s*[:=]\s*["\']?[\w.-]+["\']?',
-            r'private[_-]?key\s*[:=]\s*["\']?[\w.-]+["\']?',
-            r'authorization[:\s]+Bearer\s+[\w.-]+',
-            r'AKIA[0-9A-Z]{16}',
-            r'github_pat_[0-9a-zA-Z_]{82}',
-            r'sk-[0-9a-zA-Z]{48}',
-        ]
-        
-        found = []
-        for pattern in secret_patterns:
-            if re.search(pattern, input_str, re.IGNORECASE):
-                found.append(pattern)
-        
-        return found
+        # Hyperscan's whitespace classes and case folding differ from re's
+        # outside ASCII and on the \x1c-\x1f separators re counts as \s, so it
+        # only handles input where both engines agree.
+        if input_str.isascii() and not _RE_ONLY_WHITESPACE.search(input_str):
+            database = _secret_database()
+            if database is not None:
+                return _scan_secrets(database, input_str)
+        return [pattern for pattern, regex in cls._SECRET_REGEXES if regex.search(input_str)]
+    
+    @classmethod
+    def check_for_secrets_batch(cls, inputs: List[str]) -> List[List[str]]:
+        """
+        Check several inputs for potential secrets in one call.
+        
+        Args:
+            inputs: The input strings to check
+        
+        Returns:
+            For each input, the list of potential secret patterns found
+        """
+        return [cls.check_for_secrets(input_str) for input_str in inputs]
     
     @classmethod
     def validate_project_path(cls, project_path: str, allow_create: bool = False) -> Path:
@@ -456,3 +483,41 @@ class SecurityUtils:
             )
         
         return path
+
+
+# Characters re treats as whitespace but Hyperscan does not
+_RE_ONLY_WHITESPACE = re.compile(r'[\x1c-\x1f]')
+
+
+@lru_cache(maxsize=None)
+def _secret_database() -> Optional[Any]:
+    """Compile the secret patterns into a Hyperscan block-mode database on first use.
+    
+    Returns None when Hyperscan is not installed or rejects a pattern.
+    """
+    if hyperscan is None:
+        return None
+    patterns = SecurityUtils.SECRET_PATTERNS
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=[p.encode("ascii") for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+def _scan_secrets(database: Any, input_str: str) -> List[str]:
+    """Run a Hyperscan database over ASCII input, returning matched patterns in order."""
+    hits: Set[int] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        hits.add(pattern_id)
+
+    database.scan(input_str.encode("ascii"), match_event_handler=on_match)
+    patterns = SecurityUtils.SECRET_PATTERNS
+    return [patterns[i] for i in sorted(hits)]
@@ -1,8 +1,10 @@
 import os
 import threading
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Dict, List, Any, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import copy
 import hashlib
@@ -26,21 +28,27 @@ def _make_serializable(state: Dict[str, Any]) -> Dict[str, Any]:
     return state_copy
 
 
-@dataclass
+def _compute_checksum(state_data: Dict[str, Any]) -> str:
+    """Compute an equality-only checksum of state data.
+    
+    The state is serialised with the C JSON encoder and hashed with BLAKE2b;
+    values JSON cannot encode are hashed by their ``str()`` form.
+    """
+    state_str = json.dumps(state_data, sort_keys=True, default=str)
+    return hashlib.blake2b(state_str.encode(), digest_size=32).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
 class StateSnapshot:
     """A snapshot of state at a specific point in time."""
     timestamp: datetime
     state_data: Dict[str, Any]
     checksum: str
     operation: str
-    
-    def __post_init__(self):
-        if not self.checksum:
-            state_str = json.dumps(self.state_data, sort_keys=True)
-            self.checksum = hashlib.sha256(state_str.encode()).hexdigest()
+    payload_stripped: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class StateTransaction:
     """Represents a state transaction for rollback."""
     operation: str
@@ -48,6 +56,19 @@ class StateTransaction:
     after_snapshot: Optional[StateSnapshot] = None
     success: bool = False
     error: Optional[str] = None
+    retain_payload: bool = True
+
+
+def _strip_payload(transaction: StateTransaction) -> None:
+    """Replace a transaction's snapshots with metadata-only copies."""
+    if transaction.before_snapshot.state_data:
+        transaction.before_snapshot = replace(
+            transaction.before_snapshot, state_data={}, payload_stripped=True
+        )
+    if transaction.after_snapshot and transaction.after_snapshot.state_data:
+        transaction.after_snapshot = replace(
+            transaction.after_snapshot, state_data={}, payload_stripped=True
+        )
 
 
 class StateManager:
@@ -57,8 +78,10 @@ class StateManager:
         self._lock = threading.RLock()
         self._current_state: Optional[ProjectState] = None
         self._snapshots: List[StateSnapshot] = []
-        self._transactions: List[StateTransaction] = []
         self._max_snapshots = 10
+        self._max_transactions = 256
+        self._max_transaction_payloads = 100
+        self._transactions: deque[StateTransaction] = deque(maxlen=self._max_transactions)
         
     def get_state(self) -> Optional[ProjectState]:
         """Get current state."""
@@ -123,15 +146,21 @@ class StateManager:
         if java_class.get("imports") and not isinstance(java_class["imports"], list):
             raise ValidationError(f"{path}.imports must be a list", f"{path}.imports")
     
-    def begin_transaction(self, operation: str) -> StateTransaction:
-        """Begin a new transaction for state modifications."""
+    def begin_transaction(self, operation: str, retain_payload: bool = True) -> StateTransaction:
+        """Begin a new transaction for state modifications.
+        
+        With ``retain_payload=False`` the recorded history entry keeps only the
+        snapshot metadata (operation, timestamp, checksum) once the transaction
+        is committed or rolled back.
+        """
         with self._lock:
             snapshot = self._create_snapshot(operation)
             transaction = StateTransaction(
                 operation=operation,
                 before_snapshot=snapshot,
                 after_snapshot=None,
-                success=False
+                success=False,
+                retain_payload=retain_payload
             )
             return transaction
     
@@ -141,26 +170,50 @@ class StateManager:
             after_snapshot = self._create_snapshot(transaction.operation)
             transaction.after_snapshot = after_snapshot
             transaction.success = True
-            self._transactions.append(transaction)
+            self._record_transaction(transaction)
     
     def rollback_transaction(self, transaction: StateTransaction, error: Optional[str] = None) -> None:
-        """Rollback a transaction to the before snapshot."""
+        """Rollback a transaction to the before snapshot.
+        
+        Raises:
+            ValidationError: If the before snapshot's state payload has been
+                discarded, since there is nothing left to restore
+        """
         with self._lock:
+            if transaction.before_snapshot and transaction.before_snapshot.payload_stripped:
+                raise ValidationError(
+                    f"Cannot roll back transaction '{transaction.operation}': "
+                    "its state payload was discarded",
+                    "transaction"
+                )
             if transaction.before_snapshot:
                 self._current_state = copy.deepcopy(transaction.before_snapshot.state_data)
                 transaction.success = False
                 transaction.error = error
-                self._transactions.append(transaction)
+                self._record_transaction(transaction)
                 
                 if len(self._snapshots) > 1:
                     self._snapshots.pop()
     
+    def _record_transaction(self, transaction: StateTransaction) -> None:
+        """Append a copy of a finished transaction, dropping state payloads from older entries.
+        
+        The history holds its own copies, so stripping never touches a
+        transaction the caller still holds.
+        """
+        record = replace(transaction)
+        if not record.retain_payload:
+            _strip_payload(record)
+        self._transactions.append(record)
+        
+        if len(self._transactions) > self._max_transaction_payloads:
+            _strip_payload(self._transactions[-self._max_transaction_payloads - 1])
+    
     def _create_snapshot(self, operation: str) -> StateSnapshot:
         """Create a snapshot of the current state."""
         if self._current_state:
             state_data = _make_serializable(self._current_state)
-            state_str = json.dumps(state_data, sort_keys=True)
-            checksum = hashlib.sha256(state_str.encode()).hexdigest()
+            checksum = _compute_checksum(state_data)
             
             snapshot = StateSnapshot(
                 timestamp=datetime.now(),
@@ -179,7 +232,7 @@ class StateManager:
             return StateSnapshot(
                 timestamp=datetime.now(),
                 state_data={},
-                checksum="",
+                checksum=_compute_checksum({}),
                 operation=operation
             )
     
@@ -199,9 +252,14 @@ class StateManager:
             return [s for s in self._snapshots if s.timestamp >= timestamp]
     
     def get_transaction_history(self, limit: int = 10) -> List[StateTransaction]:
-        """Get recent transaction history."""
+        """Get recent transaction history (oldest first, at most ``limit`` entries).
+        
+        Transactions are returned as deep copies, so callers cannot alter the
+        recorded history.
+        """
         with self._lock:
-            return copy.deepcopy(self._transactions[-limit:])
+            start = max(len(self._transactions) - limit, 0)
+            return copy.deepcopy(list(islice(self._transactions, start, None)))
     
     def execute_with_rollback(
         self, 
@@ -268,13 +326,14 @@ class StateManager:
             for java_class in java_classes:
                 file_path = java_class.get("file_path")
                 if file_path:
-                    if not Path(file_path).exists():
-                        issues.append(f"Java file in state not found on filesystem: {file_path}")
-                    else:
+                    try:
                         current_mtime = Path(file_path).stat().st_mtime
-                        expected_mtime = java_class.get("last_modified")
-                        if expected_mtime and abs(current_mtime - expected_mtime) > 1:
-                            warnings.append(f"File modified since state was cached: {file_path}")
+                    except (OSError, ValueError):
+                        issues.append(f"Java file in state not found on filesystem: {file_path}")
+                        continue
+                    expected_mtime = java_class.get("last_modified")
+                    if expected_mtime and abs(current_mtime - expected_mtime) > 1:
+                        warnings.append(f"File modified since state was cached: {file_path}")
             
             return {
                 "consistent": len(issues) == 0,
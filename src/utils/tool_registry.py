@@ -1,8 +1,9 @@
+import inspect
 from typing import Any, Callable, Dict, Optional, Type
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolDefinition:
     """Definition of a tool in the registry."""
     
@@ -45,26 +46,45 @@ class ToolRegistry:
         """
         Register all tools from a module.
         
+        Only public functions and LangChain tools defined in the module itself
+        are registered (or those listed in its ``__all__``); imported symbols,
+        classes and other values are ignored. Names that are already registered are skipped.
+        
         Args:
             module_path: Python module path (e.g., "src.tools.file_tools")
+                or path to a standalone ``.py`` file; a file is loaded as a
+                top-level module, so it cannot use relative imports
         """
         import importlib
+        import importlib.util
         import sys
         
         from pathlib import Path
         
-        module_name = Path(module_path).stem
-        spec = importlib.util.spec_from_file_location(module_name, module_path)
-        
-        if spec and spec.loader:
+        if module_path.endswith(".py"):
+            module_name = Path(module_path).stem
+            spec = importlib.util.spec_from_file_location(module_name, module_path)
+            if not spec or not spec.loader:
+                return
             module = importlib.util.module_from_spec(spec)
             sys.modules[module_name] = module
             spec.loader.exec_module(module)
-            
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if callable(attr) and hasattr(attr, '__doc__'):
-                    self.register(attr_name, attr, getattr(attr, '__doc__', ''))
+        else:
+            module = importlib.import_module(module_path)
+        
+        exported = getattr(module, "__all__", None)
+        if exported is not None:
+            candidates = [(name, getattr(module, name)) for name in exported]
+        else:
+            candidates = [
+                (name, attr) for name, attr in vars(module).items()
+                if not name.startswith("_") and _defined_in(attr, module.__name__)
+            ]
+        
+        for name, attr in candidates:
+            if name in self._tools or not _is_tool(attr):
+                continue
+            self.register(name, attr, getattr(attr, '__doc__', '') or '')
     
     def get_tool(self, name: str) -> Optional[Callable]:
         """
@@ -137,6 +157,21 @@ class ToolRegistry:
         return self._tools.copy()
 
 
+def _is_tool(attr: Any) -> bool:
+    """Check whether an attribute is a plain function or a LangChain tool."""
+    if inspect.isfunction(attr):
+        return True
+    # Imported here so that importing the registry does not pull in LangChain
+    from langchain_core.tools import BaseTool
+    return isinstance(attr, BaseTool)
+
+
+def _defined_in(attr: Any, module_name: str) -> bool:
+    """Check whether a callable (or the function wrapped by a LangChain tool) lives in a module."""
+    func = getattr(attr, "func", None) or attr
+    return getattr(func, "__module__", None) == module_name
+
+
 _global_registry: Optional[ToolRegistry] = None
 
 
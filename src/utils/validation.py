@@ -1,22 +1,133 @@
 import os
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Any, Union
+from typing import Optional, Any, Collection, Sequence, Sized, Tuple, Union
 from ..exceptions.handler import ValidationError, FileOperationError
 from .security import SecurityUtils
 
 
+_SIMPLE_MAVEN_GOALS_ORDER = (
+    "compile", "test", "package", "install", "deploy",
+    "clean", "validate", "verify", "site"
+)
+_SIMPLE_MAVEN_GOALS = frozenset(_SIMPLE_MAVEN_GOALS_ORDER)
+_VALID_GOALS_DISPLAY = ", ".join(_SIMPLE_MAVEN_GOALS_ORDER + (
+    "dependency:tree", "dependency:list", "dependency:analyze",
+    "help:effective-pom", "help:describe"
+))
+
+_MAVEN_GOAL_PREFIXES_ORDER = ("dependency", "help", "exec", "surefire", "failsafe")
+_MAVEN_GOAL_PREFIXES = frozenset(_MAVEN_GOAL_PREFIXES_ORDER)
+_MAVEN_GOAL_PREFIXES_DISPLAY = ", ".join(_MAVEN_GOAL_PREFIXES_ORDER)
+
+_MAVEN_SCOPES_ORDER = ("compile", "test", "provided", "runtime", "system", "import")
+_MAVEN_SCOPES = frozenset(_MAVEN_SCOPES_ORDER)
+_MAVEN_SCOPES_DISPLAY = ", ".join(_MAVEN_SCOPES_ORDER)
+
+_MODIFIERS_ORDER = (
+    "public", "private", "protected",
+    "static", "final", "abstract", "synchronized",
+    "volatile", "transient", "native", "strictfp"
+)
+_MODIFIERS = frozenset(_MODIFIERS_ORDER)
+_MODIFIERS_DISPLAY = ", ".join(_MODIFIERS_ORDER)
+
+_JAVA_EXT = (".java",)
+
+# Error message templates; formatted with % only on the failure path.
+_CLASS_NAME_ERR = (
+    "Invalid Java class name '%s'. Class names must start with uppercase letter "
+    "and contain only alphanumeric characters and underscores."
+)
+_PACKAGE_NAME_ERR = (
+    "Invalid Java package name '%s'. Package names must be lowercase and "
+    "follow reverse domain notation (e.g., com.example.package)"
+)
+_METHOD_NAME_ERR = (
+    "Invalid Java method name '%s'. Method names must start with lowercase letter "
+    "and contain only alphanumeric characters and underscores."
+)
+_FIELD_NAME_ERR = (
+    "Invalid Java field name '%s'. Field names must start with lowercase letter "
+    "and contain only alphanumeric characters and underscores."
+)
+_ANNOTATION_NAME_ERR = (
+    "Invalid Java annotation name '%s'. Annotation names must start with @ "
+    "followed by uppercase letter and contain only alphanumeric characters and underscores."
+)
+_IMPORT_STATEMENT_ERR = (
+    "Invalid Java import statement '%s'. Must follow pattern: "
+    "'import package.Class;' or 'import static package.Class.method;'"
+)
+_MAVEN_GOAL_PREFIX_ERR = "Invalid Maven goal prefix '%s'. Valid prefixes: " + _MAVEN_GOAL_PREFIXES_DISPLAY
+_MAVEN_GOAL_ERR = "Invalid Maven goal '%s'. Valid goals: " + _VALID_GOALS_DISPLAY
+_MAVEN_SCOPE_ERR = "Field 'scope' must be one of: " + _MAVEN_SCOPES_DISPLAY + ", got '%s'"
+_MODIFIER_ERR = "Field 'modifier' must be one of: " + _MODIFIERS_DISPLAY + ", got '%s'"
+
+_ANNOTATION_NAME_RE = re.compile(r'^@[A-Z][a-zA-Z0-9_]*$')
+
+
+def _is_ascii_identifier(name: str, first_lo: str, first_hi: str) -> bool:
+    """Check for an ASCII identifier whose first character is in ``first_lo``..``first_hi``."""
+    return name.isascii() and name.isidentifier() and first_lo <= name[0] <= first_hi
+
+
+def _is_ascii_word(segment: str) -> bool:
+    """Check that a non-empty string only contains ASCII letters, digits and underscores."""
+    return bool(segment) and segment.isascii() and ("_" + segment).isidentifier()
+
+
+def _is_import_statement(import_statement: str) -> bool:
+    """Check 'import [static] a.b.Name;' shape with plain string operations.
+    
+    The path needs at least two segments: the first starts with a letter, the
+    last is '*' or starts with an uppercase letter.
+    """
+    statement = import_statement.rstrip()
+    if not statement.startswith("import") or not statement.endswith(";"):
+        return False
+    
+    words = statement[:-1].split()
+    if len(words) == 3 and words[1] == "static":
+        path = words[2]
+    elif len(words) == 2:
+        path = words[1]
+    else:
+        return False
+    if words[0] != "import":
+        return False
+    
+    segments = path.split(".")
+    if len(segments) < 2:
+        return False
+    first, *middle, last = segments
+    
+    return (
+        _is_ascii_word(first) and first[0].isalpha()
+        and all(_is_ascii_word(segment) for segment in middle)
+        and (last == "*" or _is_ascii_identifier(last, 'A', 'Z'))
+    )
+
+
 def validate_not_none(value: Any, field_name: str) -> None:
     """Validate that a value is not None."""
     if value is None:
         raise ValidationError(f"Field '{field_name}' cannot be None", field_name)
 
 
+def _require_nonempty(value: str, field_name: str) -> None:
+    """Reject None, empty and whitespace-only strings without copying the value."""
+    if value is None:
+        raise ValidationError(f"Field '{field_name}' cannot be None", field_name)
+    if not value or value.isspace():
+        raise ValidationError(f"Field '{field_name}' cannot be empty", field_name)
+
+
 def validate_not_empty(value: str, field_name: str) -> None:
     """Validate that a string is not empty."""
-    validate_not_none(value, field_name)
-    if not value.strip():
-        raise ValidationError(f"Field '{field_name}' cannot be empty", field_name)
+    _require_nonempty(value, field_name)
 
 
 def validate_path(path: Union[str, Path], field_name: str = "path") -> Path:
@@ -26,55 +137,65 @@ def validate_path(path: Union[str, Path], field_name: str = "path") -> Path:
     else:
         path_str = path
     
-    validate_not_none(path_str, field_name)
-    validate_not_empty(path_str, field_name)
+    _require_nonempty(path_str, field_name)
     
     path_obj = Path(path_str)
     return path_obj
 
 
-def validate_file_exists(file_path: Union[str, Path]) -> Path:
-    """Validate that a file exists and return its Path object."""
-    if isinstance(file_path, Path):
-        path_str = str(file_path)
-    else:
-        path_str = file_path
-    
-    path_obj = validate_path(path_str, "file_path")
+def _fast_file_path(file_path: Union[str, Path]) -> Path:
+    """Inlined not-none / not-empty / exists / is-file check for the hot file validation path."""
+    if file_path is None:
+        raise ValidationError("Field 'file_path' cannot be None", "file_path")
+    path_str = file_path if type(file_path) is str else str(file_path)
+    if not path_str or path_str.isspace():
+        raise ValidationError("Field 'file_path' cannot be empty", "file_path")
     
-    if not path_obj.exists():
-        raise FileOperationError(f"File '{file_path}' does not exist", str(path_obj))
+    try:
+        st = os.stat(path_str)
+    except (OSError, ValueError):
+        raise FileOperationError(f"File '{file_path}' does not exist", path_str)
     
-    if not path_obj.is_file():
-        raise FileOperationError(f"Path '{file_path}' is not a file", str(path_obj))
+    if not stat.S_ISREG(st.st_mode):
+        raise FileOperationError(f"Path '{file_path}' is not a file", path_str)
     
-    return path_obj
+    return Path(path_str)
+
+
+def validate_file_exists(file_path: Union[str, Path]) -> Path:
+    """Validate that a file exists and return its Path object."""
+    return _fast_file_path(file_path)
 
 
 def validate_directory_exists(directory_path: Union[str, Path]) -> Path:
     """Validate that a directory exists and return its Path object."""
-    if isinstance(directory_path, Path):
-        dir_str = str(directory_path)
-    else:
-        dir_str = directory_path
-    
-    path_obj = validate_path(dir_str, "directory_path")
+    validate_not_none(directory_path, "directory_path")
+    dir_str = directory_path if isinstance(directory_path, str) else str(directory_path)
+    _require_nonempty(dir_str, "directory_path")
     
-    if not path_obj.exists():
-        raise FileOperationError(f"Directory '{directory_path}' does not exist", str(path_obj))
+    try:
+        st = os.stat(dir_str)
+    except (OSError, ValueError):
+        raise FileOperationError(f"Directory '{directory_path}' does not exist", dir_str)
     
-    if not path_obj.is_dir():
-        raise FileOperationError(f"Path '{directory_path}' is not a directory", str(path_obj))
+    if not stat.S_ISDIR(st.st_mode):
+        raise FileOperationError(f"Path '{directory_path}' is not a directory", dir_str)
     
-    return path_obj
+    return Path(dir_str)
 
 
-def validate_file_extension(file_path: Union[str, Path], allowed_extensions: List[str]) -> None:
-    """Validate that a file has one of the allowed extensions."""
-    path_obj = Path(file_path)
-    extension = path_obj.suffix.lower()
+def validate_file_extension(file_path: Union[str, Path], allowed_extensions: Sequence[str]) -> None:
+    """Validate that a file has one of the allowed extensions.
+    
+    ``allowed_extensions`` given as a tuple is used as-is and must already be
+    lowercase; any other sequence is lowercased into a tuple first.
+    """
+    if not isinstance(allowed_extensions, tuple):
+        allowed_extensions = tuple(ext.lower() for ext in allowed_extensions)
     
-    if extension not in allowed_extensions:
+    path_str = str(file_path).lower()
+    if not path_str.endswith(allowed_extensions):
+        extension = os.path.splitext(path_str)[1]
         raise ValidationError(
             f"File '{file_path}' has invalid extension '{extension}'. "
             f"Allowed extensions: {', '.join(allowed_extensions)}",
@@ -84,30 +205,95 @@ def validate_file_extension(file_path: Union[str, Path], allowed_extensions: Lis
 
 def validate_java_file(file_path: Union[str, Path]) -> Path:
     """Validate that a path is a Java source file."""
-    validate_file_extension(file_path, [".java"])
+    validate_file_extension(file_path, _JAVA_EXT)
     return validate_file_exists(file_path)
 
 
 def validate_pom_xml(file_path: Union[str, Path]) -> Path:
     """Validate that a path is a pom.xml file."""
-    path_obj = Path(file_path)
-    if path_obj.name != "pom.xml":
-        raise ValidationError(f"File must be named 'pom.xml', got '{path_obj.name}'", "file_path")
-    return validate_file_exists(file_path)
+    path_str = file_path if isinstance(file_path, str) else str(file_path)
+    name = os.path.basename(path_str)
+    if name != "pom.xml":
+        raise ValidationError(f"File must be named 'pom.xml', got '{name}'", "file_path")
+    return _fast_file_path(path_str)
 
 
-def validate_project_directory(project_path: Union[str, Path]) -> Path:
-    """Validate that a path is a valid project directory (either has pom.xml or is a valid directory)."""
-    path_obj = validate_directory_exists(project_path)
+def _classify_project(abs_path: str) -> Tuple[bool, bool, bool]:
+    """Return ``(exists, is_dir, has_pom)`` for an absolute project path."""
+    try:
+        st = os.stat(abs_path)
+    except (OSError, ValueError):
+        return False, False, False
+    
+    is_dir = stat.S_ISDIR(st.st_mode)
+    return True, is_dir, is_dir and os.path.isfile(os.path.join(abs_path, "pom.xml"))
+
+
+class _NotAProject(Exception):
+    """Carries a negative classification out of the cache without storing it."""
     
-    pom_xml = path_obj / "pom.xml"
-    if not pom_xml.exists():
+    def __init__(self, result: Tuple[bool, bool, bool]):
+        super().__init__(result)
+        self.result = result
+
+
+@lru_cache(maxsize=1024)
+def _classify_project_cached(abs_path: str) -> Tuple[bool, bool, bool]:
+    """``_classify_project`` memoizing only paths that hold a pom.xml.
+    
+    lru_cache does not store calls that raise, so negative results (which
+    may go stale once the project is created) are raised and never cached.
+    """
+    result = _classify_project(abs_path)
+    if not result[2]:
+        raise _NotAProject(result)
+    return result
+
+
+def _cached_classify_project(abs_path: str) -> Tuple[bool, bool, bool]:
+    """Classify a project path, reusing cached positive results."""
+    try:
+        return _classify_project_cached(abs_path)
+    except _NotAProject as e:
+        return e.result
+
+
+def _check_project_directory(project_path: Union[str, Path], classify) -> Path:
+    """Shared body of the project directory validators, probing with ``classify``."""
+    validate_not_none(project_path, "directory_path")
+    path_str = project_path if isinstance(project_path, str) else str(project_path)
+    _require_nonempty(path_str, "directory_path")
+    
+    exists, is_dir, has_pom = classify(os.path.abspath(path_str))
+    
+    if not exists:
+        raise FileOperationError(f"Directory '{project_path}' does not exist", path_str)
+    
+    if not is_dir:
+        raise FileOperationError(f"Path '{project_path}' is not a directory", path_str)
+    
+    if not has_pom:
         raise FileOperationError(
             f"Project directory '{project_path}' must contain a pom.xml file",
-            str(path_obj)
+            path_str
         )
     
-    return path_obj
+    return Path(path_str)
+
+
+def validate_project_directory(project_path: Union[str, Path]) -> Path:
+    """Validate that a path is a valid project directory (either has pom.xml or is a valid directory)."""
+    return _check_project_directory(project_path, _classify_project)
+
+
+def _cached_project_directory(project_path: Union[str, Path]) -> Path:
+    """``validate_project_directory`` for read-only project analysis.
+    
+    A project once seen with a pom.xml is assumed to keep it, so this must
+    not guard anything that runs Maven or writes to the project; call
+    ``_classify_project_cached.cache_clear()`` to drop cached results.
+    """
+    return _check_project_directory(project_path, _cached_classify_project)
 
 
 def sanitize_path(path: str, allow_traversal: bool = False, allow_absolute: bool = False) -> str:
@@ -128,14 +314,21 @@ def sanitize_path(path: str, allow_traversal: bool = False, allow_absolute: bool
     return SecurityUtils.sanitize_path(path, allow_absolute=allow_absolute)
 
 
-def validate_in_allowed_values(value: Any, field_name: str, allowed_values: List[Any]) -> None:
-    """Validate that a value is one of the allowed values."""
+def validate_in_allowed_values(value: Any, field_name: str, allowed_values: Collection[Any]) -> None:
+    """Validate that a value is one of the allowed values.
+    
+    Pass a set or frozenset for O(1) membership; the values are then listed
+    in sorted order in the error message.
+    """
     validate_not_none(value, field_name)
     
     if value not in allowed_values:
+        if isinstance(allowed_values, (set, frozenset)):
+            display = ', '.join(sorted(map(str, allowed_values)))
+        else:
+            display = ', '.join(map(str, allowed_values))
         raise ValidationError(
-            f"Field '{field_name}' must be one of: {', '.join(map(str, allowed_values))}, "
-            f"got '{value}'",
+            f"Field '{field_name}' must be one of: {display}, got '{value}'",
             field_name
         )
 
@@ -159,106 +352,74 @@ def validate_range(value: Union[int, float], field_name: str, min_val: Optional[
 
 def validate_class_name(class_name: str) -> None:
     """Validate that a string is a valid Java class name."""
-    validate_not_empty(class_name, "class_name")
+    _require_nonempty(class_name, "class_name")
     
-    pattern = r'^[A-Z][a-zA-Z0-9_]*$'
-    if not re.match(pattern, class_name):
-        raise ValidationError(
-            f"Invalid Java class name '{class_name}'. Class names must start with uppercase letter "
-            f"and contain only alphanumeric characters and underscores.",
-            "class_name"
-        )
+    if not _is_ascii_identifier(class_name, 'A', 'Z'):
+        raise ValidationError(_CLASS_NAME_ERR % (class_name,), "class_name")
 
 
 def validate_package_name(package_name: str) -> None:
     """Validate that a string is a valid Java package name."""
-    validate_not_empty(package_name, "package_name")
+    _require_nonempty(package_name, "package_name")
     
-    pattern = r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$'
-    if not re.match(pattern, package_name):
-        raise ValidationError(
-            f"Invalid Java package name '{package_name}'. Package names must be lowercase and "
-            f"follow reverse domain notation (e.g., com.example.package)",
-            "package_name"
-        )
+    if not all(
+        _is_ascii_identifier(segment, 'a', 'z') and segment.islower()
+        for segment in package_name.split(".")
+    ):
+        raise ValidationError(_PACKAGE_NAME_ERR % (package_name,), "package_name")
 
 
 def validate_method_name(method_name: str) -> None:
     """Validate that a string is a valid Java method name."""
-    validate_not_empty(method_name, "method_name")
+    _require_nonempty(method_name, "method_name")
     
-    pattern = r'^[a-z][a-zA-Z0-9_]*$'
-    if not re.match(pattern, method_name):
-        raise ValidationError(
-            f"Invalid Java method name '{method_name}'. Method names must start with lowercase letter "
-            f"and contain only alphanumeric characters and underscores.",
-            "method_name"
-        )
+    if not _is_ascii_identifier(method_name, 'a', 'z'):
+        raise ValidationError(_METHOD_NAME_ERR % (method_name,), "method_name")
 
 
 def validate_field_name(field_name: str) -> None:
     """Validate that a string is a valid Java field name."""
-    validate_not_empty(field_name, "field_name")
+    _require_nonempty(field_name, "field_name")
     
-    pattern = r'^[a-z][a-zA-Z0-9_]*$'
-    if not re.match(pattern, field_name):
-        raise ValidationError(
-            f"Invalid Java field name '{field_name}'. Field names must start with lowercase letter "
-            f"and contain only alphanumeric characters and underscores.",
-            "field_name"
-        )
+    if not _is_ascii_identifier(field_name, 'a', 'z'):
+        raise ValidationError(_FIELD_NAME_ERR % (field_name,), "field_name")
 
 
 def validate_maven_goal(goal: str) -> None:
     """Validate that a string is a valid Maven goal."""
-    validate_not_empty(goal, "goal")
-    
-    valid_goals = [
-        "compile", "test", "package", "install", "deploy",
-        "clean", "validate", "verify", "site",
-        "dependency:tree", "dependency:list", "dependency:analyze",
-        "help:effective-pom", "help:describe"
-    ]
-    
-    goal_parts = goal.split(":")
-    if len(goal_parts) > 1:
-        prefix = goal_parts[0]
-        if prefix not in ["dependency", "help", "exec", "surefire", "failsafe"]:
-            raise ValidationError(
-                f"Invalid Maven goal prefix '{prefix}'. Valid prefixes: dependency, help, exec, surefire, failsafe",
-                "goal"
-            )
-    else:
-        if goal not in ["compile", "test", "package", "install", "deploy", "clean", "validate", "verify", "site"]:
-            raise ValidationError(
-                f"Invalid Maven goal '{goal}'. Valid goals: {', '.join(valid_goals)}",
-                "goal"
-            )
+    _require_nonempty(goal, "goal")
+    
+    prefix, separator, _ = goal.partition(":")
+    if separator:
+        if prefix not in _MAVEN_GOAL_PREFIXES:
+            raise ValidationError(_MAVEN_GOAL_PREFIX_ERR % (prefix,), "goal")
+    elif goal not in _SIMPLE_MAVEN_GOALS:
+        raise ValidationError(_MAVEN_GOAL_ERR % (goal,), "goal")
 
 
 def validate_maven_scope(scope: str) -> None:
     """Validate that a string is a valid Maven scope."""
-    validate_not_empty(scope, "scope")
+    _require_nonempty(scope, "scope")
     
-    valid_scopes = ["compile", "test", "provided", "runtime", "system", "import"]
-    validate_in_allowed_values(scope, "scope", valid_scopes)
+    if scope not in _MAVEN_SCOPES:
+        raise ValidationError(_MAVEN_SCOPE_ERR % (scope,), "scope")
 
 
-def validate_list_not_empty(items: List[Any], field_name: str) -> None:
-    """Validate that a list is not empty."""
-    validate_not_none(items, field_name)
-    
+def validate_list_not_empty(items: Sized, field_name: str) -> None:
+    """Validate that a list is not empty (None is reported as empty)."""
     if not items:
         raise ValidationError(f"List '{field_name}' cannot be empty", field_name)
 
 
-def validate_list_max_length(items: List[Any], field_name: str, max_length: int) -> None:
-    """Validate that a list does not exceed maximum length."""
-    validate_not_none(items, field_name)
+def validate_list_max_length(items: Sized, field_name: str, max_length: int) -> None:
+    """Validate that a list does not exceed maximum length.
     
-    if len(items) > max_length:
+    ``items`` must not be None; callers validate presence beforehand.
+    """
+    count = len(items)
+    if count > max_length:
         raise ValidationError(
-            f"List '{field_name}' exceeds maximum length of {max_length}, got {len(items)}",
+            f"List '{field_name}' exceeds maximum length of {max_length}, got {count}",
             field_name
         )
 
@@ -267,7 +428,7 @@ def validate_content_not_empty(content: str) -> None:
     """Validate that content string is not just whitespace."""
     validate_not_none(content, "content")
     
-    if not content or not content.strip():
+    if not content or content.isspace():
         raise ValidationError("Content cannot be empty or whitespace only", "content")
 
 
@@ -295,37 +456,23 @@ def validate_non_negative_integer(value: int, field_name: str) -> None:
 
 def validate_annotation_name(annotation_name: str) -> None:
     """Validate that a string is a valid Java annotation name."""
-    validate_not_empty(annotation_name, "annotation_name")
+    _require_nonempty(annotation_name, "annotation_name")
     
-    pattern = r'^@[A-Z][a-zA-Z0-9_]*$'
-    if not re.match(pattern, annotation_name):
-        raise ValidationError(
-            f"Invalid Java annotation name '{annotation_name}'. Annotation names must start with @ "
-            f"followed by uppercase letter and contain only alphanumeric characters and underscores.",
-            "annotation_name"
-        )
+    if not _ANNOTATION_NAME_RE.match(annotation_name):
+        raise ValidationError(_ANNOTATION_NAME_ERR % (annotation_name,), "annotation_name")
 
 
 def validate_import_statement(import_statement: str) -> None:
     """Validate that a string is a valid Java import statement."""
-    validate_not_empty(import_statement, "import_statement")
+    _require_nonempty(import_statement, "import_statement")
     
-    pattern = r'^(import\s+static\s+|import\s+)[a-zA-Z][a-zA-Z0-9_]*(\.[a-zA-Z0-9_]+)*\.(?:\*|[A-Z][a-zA-Z0-9_]*)\s*;$'
-    if not re.match(pattern, import_statement):
-        raise ValidationError(
-            f"Invalid Java import statement '{import_statement}'. Must follow pattern: "
-            f"'import package.Class;' or 'import static package.Class.method;'",
-            "import_statement"
-        )
+    if not _is_import_statement(import_statement):
+        raise ValidationError(_IMPORT_STATEMENT_ERR % (import_statement,), "import_statement")
 
 
 def validate_modifier(modifier: str) -> None:
     """Validate that a string is a valid Java modifier."""
-    validate_not_empty(modifier, "modifier")
-    
-    valid_modifiers = [
-        "public", "private", "protected",
-        "static", "final", "abstract", "synchronized",
-        "volatile", "transient", "native", "strictfp"
-    ]
-    validate_in_allowed_values(modifier, "modifier", valid_modifiers)
+    _require_nonempty(modifier, "modifier")
+    
+    if modifier not in _MODIFIERS:
+        raise ValidationError(_MODIFIER_ERR % (modifier,), "modifier")
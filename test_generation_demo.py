@@ -15,6 +15,48 @@ from pathlib import Path
 import argparse
 
 
+def _find_files(root: str, marker: str, suffix: str) -> list:
+    """Find files ending in ``suffix`` inside any ``marker`` directory below ``root``.
+
+    Equivalent to ``root.rglob(f"{marker}/**/*{suffix}")`` but walks with
+    ``os.walk`` and plain string checks. Returns sorted paths relative to
+    ``root`` as strings.
+    """
+    root_str = str(root)
+    prefix_len = len(os.path.join(root_str, ""))
+    marker_part = os.sep + marker + os.sep if marker else os.sep
+    found = []
+    for dirpath, _dirnames, filenames in os.walk(root_str):
+        if marker_part not in os.sep + dirpath[prefix_len:] + os.sep:
+            continue
+        for filename in filenames:
+            if filename.endswith(suffix):
+                found.append(os.path.join(dirpath, filename)[prefix_len:])
+    return sorted(found)
+
+
+def _scan(project_path_str: str) -> tuple:
+    """Scan a project tree in a single pass.
+
+    Returns ``(java_files, expected_tests, existing_tests, has_pom)``, where
+    ``existing_tests`` is ``None`` when ``src/test/java`` does not exist.
+    """
+    src_prefix = os.path.join("src", "main", "java")
+    test_prefix = os.path.join("src", "test", "java")
+    java_files = tuple(_find_files(project_path_str, src_prefix, ".java"))
+    # Convert source paths to test paths
+    expected_tests = tuple(
+        relative_path.replace(src_prefix, test_prefix, 1)[:-len(".java")] + "Test.java"
+        for relative_path in java_files
+    )
+    test_dir = os.path.join(project_path_str, test_prefix)
+    existing_tests = None
+    if os.path.isdir(test_dir):
+        existing_tests = tuple(_find_files(test_dir, "", "Test.java"))
+    has_pom = os.path.exists(os.path.join(project_path_str, "pom.xml"))
+    return java_files, expected_tests, existing_tests, has_pom
+
+
 def analyze_sample_project(project_path: str):
     """Analyze a sample project and show what tests should be generated."""
     project_dir = Path(project_path)
@@ -23,43 +65,32 @@ def analyze_sample_project(project_path: str):
     print(f"Analyzing: {project_dir.name}")
     print(f"{'='*60}\n")
     
-    # Find Java source files
-    java_files = list(project_dir.rglob("src/main/java/**/*.java"))
+    java_files, expected_tests, existing_tests, has_pom = _scan(os.path.abspath(project_path))
     
+    # Find Java source files
     print(f"Found {len(java_files)} Java source files:")
-    for java_file in java_files:
-        relative_path = java_file.relative_to(project_dir)
+    for relative_path in java_files:
         print(f"  - {relative_path}")
     
     # Determine expected test files
     print(f"\nExpected test files:")
-    for java_file in java_files:
-        relative_path = java_file.relative_to(project_dir)
-        # Convert source path to test path
-        test_path = str(relative_path).replace(
-            "src/main/java",
-            "src/test/java"
-        ).replace(".java", "Test.java")
-        
+    for test_path in expected_tests:
         print(f"  - {test_path}")
     
     print(f"\nTest file location: {project_dir / 'src/test/java'}")
     print(f"Source file location: {project_dir / 'src/main/java'}")
     
     # Check if test directory exists
-    test_dir = project_dir / "src/test/java"
-    if test_dir.exists():
-        existing_tests = list(test_dir.rglob("**/*Test.java"))
+    if existing_tests is not None:
+        test_prefix = os.path.join("src", "test", "java")
         print(f"\nExisting test files ({len(existing_tests)}):")
-        for test_file in existing_tests:
-            relative_path = test_file.relative_to(project_dir)
-            print(f"  - {relative_path}")
+        for relative_path in existing_tests:
+            print(f"  - {os.path.join(test_prefix, relative_path)}")
     else:
         print(f"\nTest directory does not exist (will be created during generation)")
     
     # Show project info
-    pom_file = project_dir / "pom.xml"
-    if pom_file.exists():
+    if has_pom:
         print(f"\n[OK] Maven project detected (pom.xml exists)")
         print(f"  Run tests with: cd {project_dir.name} && mvn test")
     else:
@@ -68,8 +99,8 @@ def analyze_sample_project(project_path: str):
     return {
         "project_name": project_dir.name,
         "java_files": len(java_files),
-        "test_directory_exists": test_dir.exists(),
-        "maven_project": pom_file.exists()
+        "test_directory_exists": existing_tests is not None,
+        "maven_project": has_pom
     }
 
 
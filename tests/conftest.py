@@ -0,0 +1,127 @@
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+import pytest
+from src.utils.state_manager import get_state_manager
+from src.utils.access_control import get_access_control_manager
+
+# Build the global managers at collection time so the first test does not
+# pay for their construction.
+get_state_manager()
+get_access_control_manager()
+
+SAMPLES_DIR = Path(__file__).resolve().parent / "samples"
+
+# RAM-backed temp root for tests that only need a scratch directory
+_FAST_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "touches_state: reset the global state manager after the test"
+    )
+    config.addinivalue_line(
+        "markers", "touches_acl: reset the global access control manager after the test"
+    )
+
+
+@pytest.fixture
+def fast_tmp_path():
+    """Per-test scratch directory on tmpfs when available, else the default temp dir."""
+    path = Path(tempfile.mkdtemp(dir=_FAST_TMP_ROOT))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+# Session-scoped sample analyses: each sample project is listed and parsed
+# once per session instead of once per test. Under xdist the first worker
+# to need a result pickles it next to the per-worker temp dirs and the
+# others load it, guarded by a file lock. The tool modules are imported
+# lazily so collecting unrelated test files does not pull in the LangChain
+# tool stack.
+
+def _list_classes(sample: str):
+    from src.tools.java_tools import list_java_classes
+    return list_java_classes.invoke({"directory": str(SAMPLES_DIR / sample)})
+
+
+def _project_state(sample: str):
+    from src.tools.maven_tools import create_project_state
+    return create_project_state.invoke({"project_path": str(SAMPLES_DIR / sample)})
+
+
+@pytest.fixture(scope="session")
+def shared_cache(request, tmp_path_factory):
+    """Return ``get(key, compute)`` memoizing values for the whole test run."""
+    workerinput = getattr(request.config, "workerinput", None)
+    values = {}
+
+    if workerinput is None:
+        # Single process: a plain dict is enough
+        def get(key, compute):
+            if key not in values:
+                values[key] = compute()
+            return values[key]
+        return get
+
+    from filelock import FileLock
+    shared_root = tmp_path_factory.getbasetemp().parent
+
+    def get(key, compute):
+        if key in values:
+            return values[key]
+        cache_file = shared_root / f"{key}.pkl"
+        with FileLock(f"{cache_file}.lock"):
+            if cache_file.is_file():
+                value = pickle.loads(cache_file.read_bytes())
+            else:
+                value = compute()
+                cache_file.write_bytes(pickle.dumps(value))
+        values[key] = value
+        return value
+    return get
+
+
+@pytest.fixture(scope="session")
+def samples_dir():
+    """Root of the bundled sample projects, shared across the session."""
+    return SAMPLES_DIR
+
+
+@pytest.fixture(scope="session")
+def junit4_classes(shared_cache):
+    return shared_cache("junit4_classes", lambda: _list_classes("junit4-sample"))
+
+
+@pytest.fixture(scope="session")
+def sample_project_state(shared_cache):
+    """Return ``get(sample)`` giving the cached ProjectState of a sample project."""
+    def get(sample):
+        return shared_cache(f"project_state_{sample}", lambda: _project_state(sample))
+    return get
+
+
+@pytest.fixture(scope="session")
+def junit4_project_state(sample_project_state):
+    return sample_project_state("junit4-sample")
+
+
+@pytest.fixture(scope="session")
+def calculator_class_state(shared_cache):
+    def analyze():
+        from src.tools.java_tools import analyze_java_class
+        calculator_file = SAMPLES_DIR / "junit4-sample" / "src" / "main" / "java" / "com" / "example" / "Calculator.java"
+        return analyze_java_class.invoke({"path": str(calculator_file)})
+    return shared_cache("calculator_class_state", analyze)
+
+
+@pytest.fixture(scope="session")
+def junit5_classes(shared_cache):
+    return shared_cache("junit5_classes", lambda: _list_classes("junit5-sample"))
+
+
+@pytest.fixture(scope="session")
+def multi_module_classes(shared_cache):
+    return shared_cache("multi_module_classes", lambda: _list_classes("multi-module"))
@@ -0,0 +1,13 @@
+package com.example;
+
+public class TestClass {
+    private String name;
+
+    public TestClass(String name) {
+        this.name = name;
+    }
+
+    public String getName() {
+        return name;
+    }
+}
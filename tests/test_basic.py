@@ -1,8 +1,5 @@
 import pytest
-import sys
-import os
-# Import directly from the config.py file
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Import directly from the config.py file (src is on pytest's pythonpath)
 from config import settings as pydantic_settings
 
 
@@ -1,24 +1,71 @@
 import unittest
-import tempfile
-import shutil
-from pathlib import Path
-import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import pytest
+from pathlib import Path
 from src.utils.state_manager import StateManager, reset_state_manager
-from src.states.project import ProjectState
+from src.states.project import ProjectState, make_default_project_state
+from src.exceptions.handler import ValidationError
+
+
+# Built once at import; _create_valid_project_state shallow-copies these
+# and fills in the per-test paths. StateManager deep-copies on set_state,
+# so the shared empty lists are never mutated through the manager.
+_BASE_JAVA_CLASS = {
+    "name": "TestClass",
+    "file_path": "",
+    "package": "com.example",
+    "content": "public class TestClass {}",
+    "type": "class",
+    "modifiers": ["public"],
+    "extends": None,
+    "implements": [],
+    "annotations": [],
+    "fields": [],
+    "methods": [],
+    "imports": [],
+    "inner_classes": [],
+    "status": "analyzed",
+    "errors": [],
+    "line_number": 1
+}
+
+_BASE_BUILD_STATUS = {
+    "last_build_time": None,
+    "build_status": "not_built",
+    "build_duration": None,
+    "goals": [],
+    "output_directory": "",
+    "test_results": {},
+    "compilation_errors": []
+}
+
+_BASE_PROJECT_STATE: ProjectState = make_default_project_state(
+    project_name="test_project",
+    description="Test project",
+    maven_group_id="com.example",
+    maven_artifact_id="test-project",
+    last_action=""
+)
+
 
 class TestStateManager(unittest.TestCase):
     """Unit tests for state_manager.py"""
     
+    @pytest.fixture(autouse=True)
+    def _use_fast_tmp_path(self, fast_tmp_path):
+        self.temp_dir = fast_tmp_path
+        # Path strings used by _create_valid_project_state, built once per test
+        self._tmp = str(fast_tmp_path)
+        self._src_main = os.path.join(self._tmp, "src", "main", "java")
+        self._src_test = os.path.join(self._tmp, "src", "test", "java")
+        self._target = os.path.join(self._tmp, "target")
+        self._test_class_file = os.path.join(self._tmp, "TestClass.java")
+    
     def setUp(self):
         self.manager = StateManager()
-        self.temp_dir = Path(tempfile.mkdtemp())
     
     def tearDown(self):
         reset_state_manager()
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
     
     def test_get_state_empty(self):
         state = self.manager.get_state()
@@ -26,64 +73,18 @@ class TestStateManager(unittest.TestCase):
     
     def _create_valid_project_state(self) -> ProjectState:
         """Helper method to create a valid ProjectState for testing."""
-        return {
-            "messages": [],
-            "project_path": str(self.temp_dir),
-            "project_name": "test_project",
-            "packaging_type": "jar",
-            "version": "1.0.0",
-            "description": "Test project",
-            "java_classes": [
-                {
-                    "name": "TestClass",
-                    "file_path": str(self.temp_dir / "TestClass.java"),
-                    "package": "com.example",
-                    "content": "public class TestClass {}",
-                    "type": "class",
-                    "modifiers": ["public"],
-                    "extends": None,
-                    "implements": [],
-                    "annotations": [],
-                    "fields": [],
-                    "methods": [],
-                    "imports": [],
-                    "inner_classes": [],
-                    "status": "analyzed",
-                    "errors": [],
-                    "line_number": 1
-                }
-            ],
-            "test_classes": [],
-            "current_class": None,
-            "maven_group_id": "com.example",
-            "maven_artifact_id": "test-project",
-            "dependencies": [],
-            "test_dependencies": [],
-            "transitive_dependencies": [],
-            "dependency_graph": {},
-            "plugins": [],
-            "build_status": {
-                "last_build_time": None,
-                "build_status": "not_built",
-                "build_duration": None,
-                "goals": [],
-                "output_directory": str(self.temp_dir / "target"),
-                "test_results": {},
-                "compilation_errors": []
-            },
-            "last_action": "",
-            "summary_report": None,
-            "source_directory": str(self.temp_dir / "src" / "main" / "java"),
-            "test_directory": str(self.temp_dir / "src" / "test" / "java"),
-            "output_directory": str(self.temp_dir / "target"),
-            "has_spring": False,
-            "has_junit": False,
-            "has_mockito": False,
-            "retry_count": 0,
-            "max_retries": 3,
-            "test_results": {},
-            "all_tests_passed": False
+        state = _BASE_PROJECT_STATE.copy()
+        state["project_path"] = self._tmp
+        state["java_classes"] = [
+            {**_BASE_JAVA_CLASS, "file_path": self._test_class_file}
+        ]
+        state["build_status"] = {
+            **_BASE_BUILD_STATUS, "output_directory": self._target
         }
+        state["source_directory"] = self._src_main
+        state["test_directory"] = self._src_test
+        state["output_directory"] = self._target
+        return state
     
     def test_set_state_success(self):
         test_state = self._create_valid_project_state()
@@ -186,6 +187,30 @@ class TestStateManager(unittest.TestCase):
         self.assertFalse(result["consistent"])
         self.assertIn("nonexistent", result["issues"][0])
     
+    def test_verify_state_consistency_file_under_regular_file(self):
+        test_state = self._create_valid_project_state()
+        regular_file = self.temp_dir / "NotADirectory"
+        regular_file.write_text("")
+        missing = str(regular_file / "TestClass.java")
+        test_state["java_classes"][0]["file_path"] = missing
+        
+        self.manager.set_state(test_state)
+        result = self.manager.verify_state_consistency()
+        
+        self.assertFalse(result["consistent"])
+        self.assertEqual([f"Java file in state not found on filesystem: {missing}"], result["issues"])
+    
+    def test_verify_state_consistency_file_path_with_nul_byte(self):
+        test_state = self._create_valid_project_state()
+        bad_path = os.path.join(self._tmp, "Bad\0Class.java")
+        test_state["java_classes"][0]["file_path"] = bad_path
+        
+        self.manager.set_state(test_state)
+        result = self.manager.verify_state_consistency()
+        
+        self.assertFalse(result["consistent"])
+        self.assertEqual([f"Java file in state not found on filesystem: {bad_path}"], result["issues"])
+    
     def test_invalidate_class_state(self):
         test_state = self._create_valid_project_state()
         self.manager.set_state(test_state)
@@ -216,6 +241,28 @@ class TestStateManager(unittest.TestCase):
         self.assertIsNotNone(snapshot.checksum)
         self.assertIsNotNone(snapshot.operation)
     
+    def test_snapshot_checksum_tracks_state(self):
+        test_state = self._create_valid_project_state()
+        self.manager.set_state(test_state)
+        first = self.manager.get_snapshot().checksum
+        
+        self.manager.set_state(self._create_valid_project_state())
+        self.assertEqual(first, self.manager.get_snapshot().checksum)
+        
+        test_state["version"] = "1.0.1"
+        self.manager.set_state(test_state)
+        self.assertNotEqual(first, self.manager.get_snapshot().checksum)
+    
+    def test_snapshot_checksum_distinguishes_large_int_from_string(self):
+        test_state = self._create_valid_project_state()
+        test_state["version"] = 1 << 70
+        self.manager.set_state(test_state)
+        as_int = self.manager.get_snapshot().checksum
+        
+        test_state["version"] = str(1 << 70)
+        self.manager.set_state(test_state)
+        self.assertNotEqual(as_int, self.manager.get_snapshot().checksum)
+    
     def test_get_transaction_history(self):
         # Set initial state
         test_state = self._create_valid_project_state()
@@ -246,6 +293,80 @@ class TestStateManager(unittest.TestCase):
         
         self.assertEqual(3, len(history))
 
+    
+    def test_get_transaction_history_returns_copies(self):
+        test_state = self._create_valid_project_state()
+        self.manager.set_state(test_state)
+        
+        transaction = self.manager.begin_transaction("test")
+        self.manager.commit_transaction(transaction)
+        
+        history = self.manager.get_transaction_history(limit=1)
+        history[0].success = False
+        history[0].after_snapshot.state_data["project_name"] = "changed"
+        
+        recorded = self.manager.get_transaction_history(limit=1)[0]
+        self.assertTrue(recorded.success)
+        self.assertEqual(test_state["project_name"], recorded.after_snapshot.state_data["project_name"])
+    
+    def test_transaction_history_is_bounded(self):
+        test_state = self._create_valid_project_state()
+        self.manager.set_state(test_state)
+        
+        for i in range(self.manager._max_transactions + 5):
+            transaction = self.manager.begin_transaction(f"test{i}")
+            self.manager.commit_transaction(transaction)
+        
+        self.assertEqual(self.manager._max_transactions, len(self.manager._transactions))
+        history = self.manager.get_transaction_history(limit=1)
+        self.assertEqual(f"test{self.manager._max_transactions + 4}", history[0].operation)
+
+    
+    def test_transaction_without_payload_keeps_metadata(self):
+        test_state = self._create_valid_project_state()
+        self.manager.set_state(test_state)
+        
+        transaction = self.manager.begin_transaction("light", retain_payload=False)
+        checksum = transaction.before_snapshot.checksum
+        self.manager.commit_transaction(transaction)
+        
+        recorded = self.manager.get_transaction_history(limit=1)[0]
+        self.assertTrue(recorded.success)
+        self.assertEqual({}, recorded.before_snapshot.state_data)
+        self.assertEqual(checksum, recorded.before_snapshot.checksum)
+    
+    def test_old_transactions_lose_payload(self):
+        test_state = self._create_valid_project_state()
+        self.manager.set_state(test_state)
+        self.manager._max_transaction_payloads = 2
+        
+        transactions = []
+        for i in range(4):
+            transaction = self.manager.begin_transaction(f"test{i}")
+            self.manager.commit_transaction(transaction)
+            transactions.append(transaction)
+        
+        history = self.manager.get_transaction_history(limit=4)
+        self.assertEqual([True, True, False, False],
+                         [t.before_snapshot.payload_stripped for t in history])
+        self.assertEqual({}, history[0].before_snapshot.state_data)
+        self.assertEqual(test_state["project_name"], history[-1].before_snapshot.state_data["project_name"])
+        # The caller's own transaction objects are left intact
+        self.assertFalse(transactions[0].before_snapshot.payload_stripped)
+        self.assertEqual(test_state["project_name"], transactions[0].before_snapshot.state_data["project_name"])
+    
+    def test_rollback_without_payload_raises(self):
+        test_state = self._create_valid_project_state()
+        self.manager.set_state(test_state)
+        
+        transaction = self.manager.begin_transaction("light", retain_payload=False)
+        self.manager.commit_transaction(transaction)
+        recorded = self.manager.get_transaction_history(limit=1)[0]
+        
+        with self.assertRaises(ValidationError):
+            self.manager.rollback_transaction(recorded, "Too late")
+        self.assertEqual(test_state["project_name"], self.manager.get_state()["project_name"])
+
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
@@ -0,0 +1,79 @@
+import unittest
+import tempfile
+import os
+import pytest
+from langchain_core.tools import BaseTool
+from src.utils.tool_registry import ToolRegistry
+
+
+class TestToolRegistry(unittest.TestCase):
+    """Unit tests for ToolRegistry.register_module"""
+
+    def setUp(self):
+        self.registry = ToolRegistry()
+
+    def test_register_module_without_all_registers_tools(self):
+        self.registry.register_module("src.tools.java_tools")
+
+        tools = set(self.registry.list_tools())
+        self.assertLessEqual({"analyze_java_class", "list_java_classes", "add_import"}, tools)
+        self.assertIsInstance(self.registry.get_tool("analyze_java_class"), BaseTool)
+        # Imported helpers are not registered
+        self.assertNotIn("validate_file_exists", tools)
+
+    def test_register_module_with_all(self):
+        self.registry.register_module("src.tools.file_tools")
+
+        tools = set(self.registry.list_tools())
+        self.assertLessEqual({"read_file", "write_file", "list_files", "list_directories", "delete_file"}, tools)
+        self.assertIn("read_file_func", tools)
+
+    def test_register_module_skips_registered_names(self):
+        self.registry.register_module("src.tools.file_tools")
+        registered = self.registry.list_tools()
+
+        self.registry.register_module("src.tools.file_tools")
+
+        self.assertEqual(registered, self.registry.list_tools())
+
+    def test_register_module_ignores_non_tools_in_all(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            module_file = os.path.join(temp_dir, "exported_tools.py")
+            with open(module_file, "w", encoding="utf-8") as f:
+                f.write(
+                    "__all__ = ['run', 'Runner', 'VERSION']\n"
+                    "VERSION = '1.0'\n"
+                    "class Runner:\n"
+                    "    pass\n"
+                    "def run():\n"
+                    "    pass\n"
+                )
+
+            self.registry.register_module(module_file)
+
+        self.assertEqual(["run"], self.registry.list_tools())
+
+    def test_register_module_from_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            module_file = os.path.join(temp_dir, "standalone_tools.py")
+            with open(module_file, "w", encoding="utf-8") as f:
+                f.write(
+                    "import os\n"
+                    "def greet(name):\n"
+                    "    \"\"\"Say hello.\"\"\"\n"
+                    "    return f'hello {name}'\n"
+                    "def _private():\n"
+                    "    pass\n"
+                    "class Helper:\n"
+                    "    pass\n"
+                )
+
+            self.registry.register_module(module_file)
+
+        self.assertEqual(["greet"], self.registry.list_tools())
+        self.assertEqual("hello world", self.registry.get_tool("greet")("world"))
+        self.assertEqual("Say hello.", self.registry.get_tool_info("greet").description)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -1,19 +1,37 @@
 import unittest
+import pytest
 from pathlib import Path
-import tempfile
-import shutil
+from contextlib import ExitStack
 from unittest.mock import Mock, patch
+from pyfakefs import fake_filesystem_unittest
 from langchain_core.tools import tool
-import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-# Import undecorated functions
+# TestFileTools runs against the undecorated functions and, via a subclass, the LangChain tools
 from src.tools.file_tools import read_file_func, write_file_func, list_files_func, list_directories_func, delete_file_func
-from src.tools.java_tools import analyze_java_class, list_java_classes
+from src.tools.file_tools import read_file, write_file, list_files, list_directories, delete_file
+from src.tools.java_tools import analyze_java_class, list_java_classes, _analyze_java_file_cached
 from src.tools.maven_tools import create_project_state
 from src.utils.validation import ValidationError, FileOperationError
 
+JAVA_FIXTURES = Path(__file__).resolve().parent / "fixtures" / "java"
+
+
+def _fast_write(path, data):
+    """Write UTF-8 text with a single open/write/close."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+def _scandir_names(path):
+    """Return the entry names in path from a single os.scandir call."""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
 # Helper function to invoke LangChain tools
 def invoke_tool(tool, **kwargs):
     """Invoke a LangChain tool with given arguments."""
@@ -23,94 +41,121 @@ def invoke_tool(tool, **kwargs):
         return tool(**kwargs)
 
 
-class TestFileTools(unittest.TestCase):
+class TestFileTools(fake_filesystem_unittest.TestCase):
     """Unit tests for file_tools.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        # These tests only check the tools' return values, so they run on an
+        # in-memory filesystem set up once per class. Each test writes into
+        # its own subdirectory of the fake root; paths stay plain strings.
+        cls.setUpClassPyfakefs()
+        cls.temp_root = "/fake"
+        cls.read_fixture_path = os.path.join(cls.temp_root, "test.txt")
+        cls.fake_fs().create_file(cls.read_fixture_path, contents="Test content")
+
     def setUp(self):
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = os.path.join(self.temp_root, self._testMethodName)
+        os.mkdir(self.temp_dir)
 
-    def tearDown(self):
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    def _call(self, func, **kwargs):
+        """Call a file tool through its undecorated function."""
+        return func(**kwargs)
 
     def test_read_file_success(self):
-        test_file = self.temp_dir / "test.txt"
-        test_file.write_text("Test content", encoding="utf-8")
-
-        result = read_file_func(str(test_file))
+        result = self._call(read_file_func, file_path=self.read_fixture_path)
 
         self.assertEqual("Test content", result)
 
     def test_read_file_not_exists(self):
-        result = read_file_func("/nonexistent/file.txt")
+        result = self._call(read_file_func, file_path="/nonexistent/file.txt")
 
         self.assertIn("does not exist", result)
 
     def test_write_file_success(self):
-        test_file = self.temp_dir / "test.txt"
+        test_file = os.path.join(self.temp_dir, "test.txt")
 
-        result = write_file_func(str(test_file), "New content")
+        result = self._call(write_file_func, file_path=test_file, content="New content")
 
         self.assertIn("Successfully wrote", result)
-        self.assertTrue(test_file.exists())
-
-    def test_write_file_creates_directories(self):
-        test_file = self.temp_dir / "newdir" / "test.txt"
-
-        result = write_file_func(str(test_file), "Content")
-
-        self.assertTrue(test_file.exists())
-        self.assertTrue((self.temp_dir / "newdir").exists())
+        self.assertTrue(os.path.exists(test_file))
 
     def test_list_files(self):
-        test_file1 = self.temp_dir / "file1.txt"
-        test_file2 = self.temp_dir / "file2.txt"
-        test_file1.write_text("Content 1", encoding="utf-8")
-        test_file2.write_text("Content 2", encoding="utf-8")
+        _fast_write(os.path.join(self.temp_dir, "file1.txt"), "Content 1")
+        _fast_write(os.path.join(self.temp_dir, "file2.txt"), "Content 2")
 
-        result = list_files_func(str(self.temp_dir))
+        result = self._call(list_files_func, directory_path=self.temp_dir)
 
-        self.assertIn("file1.txt", result)
-        self.assertIn("file2.txt", result)
+        names = _scandir_names(self.temp_dir)
+        self.assertEqual({"file1.txt", "file2.txt"}, names)
+        self.assertEqual(names, set(result.splitlines()))
 
     def test_list_directories(self):
-        test_dir = self.temp_dir / "subdir"
-        test_dir.mkdir()
+        os.mkdir(os.path.join(self.temp_dir, "subdir"))
 
-        result = list_directories_func(str(self.temp_dir))
+        result = self._call(list_directories_func, directory_path=self.temp_dir)
 
         self.assertIn("subdir", result)
 
     def test_delete_file(self):
-        test_file = self.temp_dir / "test.txt"
-        test_file.write_text("To delete", encoding="utf-8")
+        test_file = os.path.join(self.temp_dir, "test.txt")
+        _fast_write(test_file, "To delete")
 
-        result = delete_file_func(str(test_file))
+        result = self._call(delete_file_func, file_path=test_file)
 
         self.assertIn("Successfully deleted", result)
-        self.assertFalse(test_file.exists())
+        self.assertFalse(os.path.exists(test_file))
 
     def test_delete_file_not_exists(self):
-        result = delete_file_func("/nonexistent/file.txt")
+        result = self._call(delete_file_func, file_path="/nonexistent/file.txt")
 
         self.assertIn("does not exist", result)
 
 
+class TestDecoratedFileTools(TestFileTools):
+    """Runs the TestFileTools cases through the LangChain tool wrappers"""
+
+    _TOOLS = {
+        read_file_func: read_file,
+        write_file_func: write_file,
+        list_files_func: list_files,
+        list_directories_func: list_directories,
+        delete_file_func: delete_file,
+    }
+
+    def _call(self, func, **kwargs):
+        return invoke_tool(self._TOOLS[func], **kwargs)
+
+
+class TestFileToolsRealFilesystem(unittest.TestCase):
+    """file_tools.py tests that depend on real directory creation"""
+
+    @pytest.fixture(autouse=True)
+    def _use_fast_tmp_path(self, fast_tmp_path):
+        self.temp_dir = str(fast_tmp_path)
+
+    def test_write_file_creates_directories(self):
+        test_file = os.path.join(self.temp_dir, "newdir", "test.txt")
+
+        result = write_file_func(test_file, "Content")
+
+        self.assertTrue(os.path.exists(test_file))
+
+
 class TestJavaTools(unittest.TestCase):
     """Unit tests for java_tools.py"""
 
-    def setUp(self):
-        self.temp_dir = Path(tempfile.mkdtemp())
+    # The checked-in fixtures are the shared read-only Java corpus and are
+    # analyzed in place; tests that write files get their own scratch dir.
+    corpus_dir = JAVA_FIXTURES
+    testclass_path = JAVA_FIXTURES / "TestClass.java"
 
-    def tearDown(self):
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _use_fast_tmp_path(self, fast_tmp_path):
+        self.temp_dir = fast_tmp_path
 
     def test_list_java_classes_success(self):
-        java_file = self.temp_dir / "TestClass.java"
-        java_file.write_text("public class TestClass {}", encoding="utf-8")
-
-        result = invoke_tool(list_java_classes, directory=str(self.temp_dir))
+        result = invoke_tool(list_java_classes, directory=str(self.corpus_dir))
 
         self.assertIsInstance(result, list)
         self.assertGreater(len(result), 0)
@@ -125,44 +170,58 @@ class TestJavaTools(unittest.TestCase):
         self.assertEqual([], result)
 
     def test_analyze_java_class_success(self):
-        java_file = self.temp_dir / "TestClass.java"
-        java_content = """package com.example;
-
-public class TestClass {
-    private String name;
-
-    public TestClass(String name) {
-        this.name = name;
-    }
-
-    public String getName() {
-        return name;
-    }
-}
-"""
-        java_file.write_text(java_content, encoding="utf-8")
-
-        result = invoke_tool(analyze_java_class, path=str(java_file))
+        result = invoke_tool(analyze_java_class, path=str(self.testclass_path))
 
         self.assertEqual("TestClass", result["name"])
         self.assertEqual("com.example", result["package"])
         self.assertTrue(len(result["fields"]) >= 1)
         self.assertTrue(len(result["methods"]) >= 1)
 
+    def test_analyze_java_class_reuses_parse_of_shared_corpus(self):
+        invoke_tool(analyze_java_class, path=str(self.testclass_path))
+        hits = _analyze_java_file_cached.cache_info().hits
+
+        result = invoke_tool(analyze_java_class, path=str(self.testclass_path))
+
+        self.assertEqual(hits + 1, _analyze_java_file_cached.cache_info().hits)
+        self.assertEqual("TestClass", result["name"])
+
+    def test_analyze_java_class_cache_tracks_file_changes(self):
+        java_file = self.temp_dir / "Cached.java"
+        _fast_write(java_file, "public class Cached {}")
+
+        first = invoke_tool(analyze_java_class, path=str(java_file))
+        first["methods"].append("mutated")
+        second = invoke_tool(analyze_java_class, path=str(java_file))
+        self.assertEqual([], second["methods"])
+
+        _fast_write(java_file, "public class Cached { void run() {} }")
+        third = invoke_tool(analyze_java_class, path=str(java_file))
+        self.assertEqual(1, len(third["methods"]))
+
+
 class TestMavenTools(unittest.TestCase):
     """Unit tests for maven_tools.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Patch once for the whole class; the class cleanup closes the stack
+        # and restores the Path attributes.
+        stack = ExitStack()
+        cls.addClassCleanup(stack.close)
+        stack.enter_context(patch.multiple(
+            'pathlib.Path',
+            cwd=Mock(return_value=Path.cwd()),
+            exists=Mock(return_value=True),
+            is_dir=Mock(return_value=True),
+        ))
+
     def test_create_project_state_success(self):
-        with patch('pathlib.Path.cwd', return_value=Path.cwd()):
-            with patch('pathlib.Path.exists', return_value=True):
-                with patch('pathlib.Path.is_dir', return_value=True):
-                    result = invoke_tool(create_project_state, project_path=".")
+        result = invoke_tool(create_project_state, project_path=".")
 
-                    self.assertIsInstance(result, dict)
-                    self.assertIn("project_path", result)
-                    self.assertIn("java_classes", result)
-                    self.assertIn("dependencies", result)
+        self.assertIsInstance(result, dict)
+        self.assertLessEqual({"project_path", "java_classes", "dependencies"}, result.keys())
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])